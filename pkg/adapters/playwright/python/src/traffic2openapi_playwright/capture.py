@@ -2,20 +2,80 @@
 Playwright traffic capture module.
 """
 
+from __future__ import annotations
+
+import collections
+import functools
+import hashlib
 import json
+import queue
 import re
+import threading
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 from urllib.parse import parse_qs, urlparse
 
-from playwright.sync_api import BrowserContext, Page, Request as PWRequest, Response as PWResponse
-from playwright.async_api import BrowserContext as AsyncBrowserContext
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    # Playwright's import is expensive; the capture module only needs these
+    # names for annotations, so keep it out of the runtime import graph.
+    from playwright.sync_api import (
+        BrowserContext,
+        Request as PWRequest,
+        Response as PWResponse,
+    )
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+
+from .types import _METHOD_MAP, _record_id, _utc_timestamp
+from .writer import (
+    NDJSONWriter,
+    GzipNDJSONWriter,
+    GzipMemberNDJSONWriter,
+    ZstdNDJSONWriter,
+    Record,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Cached URL parser: the same URL is seen by _should_capture and
+# _create_record, and SPAs revisit the same endpoints repeatedly.
+_urlparse = functools.lru_cache(maxsize=4096)(urlparse)
+
+
+# Upper bound on cached parsed bodies; polling endpoints return
+# byte-identical payloads, so repeats skip the JSON parse entirely
+_MAX_BODY_CACHE = 256
+
+
+# Upper bound on tracked in-flight requests; responses that never arrive
+# (aborted navigations, preflights, upgrades) would otherwise leak entries
+# in a long-running capture
+_MAX_PENDING_REQUESTS = 4096
 
-from .types import IRRecord, Request, Response, RequestMethod
-from .writer import NDJSONWriter, GzipNDJSONWriter
+
+# Scoped inline-flag letters used when folding compiled patterns into
+# one alternation
+_INLINE_FLAG_LETTERS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+def _inline_group(pattern: re.Pattern) -> str:
+    """Wrap a compiled pattern in a group that keeps its compile flags."""
+    letters = "".join(
+        letter for flag, letter in _INLINE_FLAG_LETTERS if pattern.flags & flag
+    )
+    if letters:
+        return f"(?{letters}:{pattern.pattern})"
+    return f"(?:{pattern.pattern})"
 
 
 # Default headers to exclude (security-sensitive)
@@ -61,13 +121,40 @@ class CaptureOptions:
         "text/html",
     ])
 
-    # Compression
+    # Compression: "gzip", "gzip-members" (parallel per-batch gzip members),
+    # "zstd", or "none"; None selects based on the gzip flag and the output
+    # suffix (".gz" / ".zst").
+    compression: Optional[str] = None
     gzip: bool = False
-    compression_level: int = 9
+    compression_level: int = 1
+
+    # Background writing: hand records to a dedicated writer thread so
+    # serialization and disk I/O stay off the Playwright event loop.
+    background_write: bool = True
+    queue_size: int = 1024
 
     # Error handling
     on_error: Optional[Callable[[Exception], None]] = None
 
+    def __post_init__(self):
+        """Precompile filter structures used on the per-request hot path."""
+        self._filter_hosts = frozenset(self.filter_hosts)
+        self._filter_methods = frozenset(m.upper() for m in self.filter_methods)
+        self._exclude_paths = frozenset(self.exclude_paths)
+        # Collapse all path patterns into one alternation so exclusion
+        # costs a single C-level regex call instead of N Python-level
+        # calls; matched with .match like the per-pattern originals.
+        # Scoped groups keep each pattern's flags, but numbered
+        # backreferences shift across patterns (use named groups instead).
+        if self.exclude_path_patterns:
+            self._exclude_path_re = re.compile(
+                "|".join(_inline_group(p) for p in self.exclude_path_patterns)
+            )
+        else:
+            self._exclude_path_re = None
+        self._exclude_headers_lc = frozenset(h.lower() for h in self.exclude_headers)
+        self._capture_content_types = tuple(self.capture_content_types)
+
 
 class PlaywrightCapture:
     """
@@ -120,16 +207,71 @@ class PlaywrightCapture:
             self.options = CaptureOptions(output=output, **kwargs)
 
         # Create writer
-        if self.options.gzip or str(self.options.output).endswith(".gz"):
+        compression = self.options.compression
+        if compression is None:
+            output_name = str(self.options.output)
+            if self.options.gzip or output_name.endswith(".gz"):
+                compression = "gzip"
+            elif output_name.endswith(".zst"):
+                compression = "zstd"
+            else:
+                compression = "none"
+
+        # With a background writer thread, flush()/close() run on the caller
+        # thread while writes happen on the writer thread, so the writer
+        # itself must lock; the per-write cost stays off the Playwright loop.
+        thread_safe = self.options.background_write
+
+        if compression == "gzip":
             self._writer = GzipNDJSONWriter(
                 self.options.output,
                 compression_level=self.options.compression_level,
+                thread_safe=thread_safe,
             )
+        elif compression == "gzip-members":
+            self._writer = GzipMemberNDJSONWriter(
+                self.options.output,
+                compression_level=self.options.compression_level,
+                thread_safe=thread_safe,
+            )
+        elif compression == "zstd":
+            self._writer = ZstdNDJSONWriter(
+                self.options.output,
+                compression_level=self.options.compression_level,
+                thread_safe=thread_safe,
+            )
+        elif compression == "none":
+            self._writer = NDJSONWriter(self.options.output, thread_safe=thread_safe)
         else:
-            self._writer = NDJSONWriter(self.options.output)
+            raise ValueError(
+                f"Unknown compression {compression!r}; "
+                "expected 'gzip', 'gzip-members', 'zstd', or 'none'"
+            )
+
+        # Parsed-body cache keyed by a short blake2b digest of the raw
+        # bytes plus the parse mode
+        self._body_cache: dict[tuple[bytes, bool], object] = {}
+
+        # Track pending request start times, keyed by request identity so
+        # concurrent requests to the same URL don't collide, and bounded
+        # so lost responses can't leak memory. Only the timestamp is
+        # stored: ids can be reused after garbage collection, and a stale
+        # timestamp merely skews durationMs instead of corrupting the URL.
+        self._pending_requests: collections.OrderedDict[int, float] = (
+            collections.OrderedDict()
+        )
 
-        # Track pending requests (for timing)
-        self._pending_requests: dict[str, tuple[PWRequest, float]] = {}
+        # Background writer thread (None when writing inline)
+        self._queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        if self.options.background_write:
+            self._queue = queue.Queue(maxsize=self.options.queue_size)
+            self._writer_thread = threading.Thread(
+                target=self._drain_loop,
+                name="traffic2openapi-writer",
+                daemon=True,
+            )
+            self._writer_thread.start()
 
     def attach(self, context: BrowserContext) -> None:
         """
@@ -153,15 +295,19 @@ class PlaywrightCapture:
 
     def _on_request(self, request: PWRequest) -> None:
         """Handle request event."""
-        # Store request with timestamp for duration calculation
-        self._pending_requests[request.url] = (request, time.time())
+        # Store timestamp for duration calculation; evict the oldest
+        # entry when full
+        pending = self._pending_requests
+        if len(pending) >= _MAX_PENDING_REQUESTS:
+            pending.popitem(last=False)
+        pending[id(request)] = time.time()
 
     def _on_response(self, response: PWResponse) -> None:
         """Handle response event (sync)."""
         try:
             record = self._create_record(response)
             if record:
-                self._writer.write(record)
+                self._write_record(record)
         except Exception as e:
             if self.options.on_error:
                 self.options.on_error(e)
@@ -171,216 +317,317 @@ class PlaywrightCapture:
         try:
             record = await self._create_record_async(response)
             if record:
-                self._writer.write(record)
+                self._write_record(record)
         except Exception as e:
             if self.options.on_error:
                 self.options.on_error(e)
 
+    def _write_record(self, record: Record) -> None:
+        """Hand a record to the background writer, or write inline."""
+        if self._queue is not None:
+            # Raises queue.Full when the writer can't keep up; the response
+            # handlers report it via on_error rather than blocking the
+            # Playwright event loop.
+            self._queue.put_nowait(record)
+        else:
+            self._writer.write(record)
+
+    def _drain_loop(self) -> None:
+        """Consume queued records and write them in batches (writer thread)."""
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            batch = [item]
+            while len(batch) < 64:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self._writer.write_many(batch)
+            except Exception as e:
+                if self.options.on_error:
+                    self.options.on_error(e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                if stop:
+                    self._queue.task_done()
+
     def _should_capture(self, request: PWRequest) -> bool:
         """Check if request should be captured based on filters."""
-        url = urlparse(request.url)
+        url = _urlparse(request.url)
+        opts = self.options
 
         # Host filter
-        if self.options.filter_hosts:
-            if url.hostname not in self.options.filter_hosts:
-                return False
+        if opts._filter_hosts and url.hostname not in opts._filter_hosts:
+            return False
 
         # Method filter
-        if self.options.filter_methods:
-            if request.method.upper() not in [m.upper() for m in self.options.filter_methods]:
-                return False
+        if opts._filter_methods and request.method.upper() not in opts._filter_methods:
+            return False
 
         # Path exclusion
-        if self.options.exclude_paths:
-            if url.path in self.options.exclude_paths:
-                return False
+        if url.path in opts._exclude_paths:
+            return False
 
-        # Path pattern exclusion
-        for pattern in self.options.exclude_path_patterns:
-            if pattern.match(url.path):
-                return False
+        # Path pattern exclusion (single combined regex, anchored like
+        # per-pattern .match)
+        if opts._exclude_path_re is not None and opts._exclude_path_re.match(url.path):
+            return False
 
         return True
 
     def _filter_headers(self, headers: dict[str, str]) -> dict[str, str]:
-        """Filter out excluded headers."""
+        """Filter out excluded headers (keys lowercased)."""
+        return self._filter_headers_lc({k.lower(): v for k, v in headers.items()})
+
+    def _filter_headers_lc(self, headers: dict[str, str]) -> dict[str, str]:
+        """Filter an already-lowercased header dict."""
         if not self.options.include_headers:
             return {}
-        return {
-            k.lower(): v
-            for k, v in headers.items()
-            if k.lower() not in self.options.exclude_headers
-        }
+        exclude = self.options._exclude_headers_lc
+        return {k: v for k, v in headers.items() if k not in exclude}
 
     def _should_capture_body(self, content_type: Optional[str]) -> bool:
         """Check if body should be captured based on content type."""
         if not content_type:
             return False
-        # Check if content type starts with any allowed type
-        for allowed in self.options.capture_content_types:
-            if content_type.startswith(allowed):
-                return True
-        return False
+        # Drop parameters ("; charset=utf-8") before matching; startswith
+        # accepts a tuple of prefixes and checks them all in C
+        return (
+            content_type.split(";", 1)[0]
+            .strip()
+            .startswith(self.options._capture_content_types)
+        )
+
+    def _should_read_body(
+        self,
+        response: PWResponse,
+        request: PWRequest,
+        resp_headers: dict[str, str],
+    ) -> bool:
+        """Check if the response body is worth fetching from the browser."""
+        # No-body statuses and HEAD never carry a payload
+        if response.status in (204, 304) or request.method.upper() == "HEAD":
+            return False
+        # Oversized bodies would be discarded by _parse_body; skip the
+        # cross-process body() call entirely
+        content_length = resp_headers.get("content-length")
+        if content_length:
+            try:
+                if int(content_length) > self.options.max_body_size:
+                    return False
+            except ValueError:
+                pass
+        return True
 
     def _parse_body(self, body: bytes, content_type: Optional[str]) -> Optional[any]:
         """Parse body based on content type."""
         if not body or len(body) > self.options.max_body_size:
             return None
 
+        # The parse result depends on the mode as well as the bytes:
+        # b"123" is the string "123" as text but the int 123 as JSON
+        is_json = bool(content_type) and "json" in content_type
+        key = (hashlib.blake2b(body, digest_size=8).digest(), is_json)
+        parsed = self._body_cache.get(key)
+        if parsed is not None:
+            return parsed
+
         try:
-            if content_type and "json" in content_type:
-                return json.loads(body.decode("utf-8"))
+            if is_json:
+                # orjson parses bytes directly, skipping the decode pass
+                if orjson is not None:
+                    parsed = orjson.loads(body)
+                else:
+                    parsed = json.loads(body)
             else:
-                return body.decode("utf-8")
-        except (json.JSONDecodeError, UnicodeDecodeError):
+                parsed = body.decode("utf-8")
+        except (ValueError, UnicodeDecodeError):
             return None
 
-    def _create_record(self, response: PWResponse) -> Optional[IRRecord]:
-        """Create IR record from Playwright response (sync)."""
-        request = response.request
+        if len(self._body_cache) >= _MAX_BODY_CACHE:
+            self._body_cache.clear()
+        self._body_cache[key] = parsed
+        return parsed
 
-        if not self._should_capture(request):
+    def _pop_pending(self, request: PWRequest) -> Optional[float]:
+        """Pop the recorded start time for a request, if any."""
+        return self._pending_requests.pop(id(request), None)
+
+    def _get_request_body(
+        self, request: PWRequest, req_headers: dict[str, str]
+    ) -> Optional[any]:
+        """Extract and parse the request body, if captured."""
+        if not self.options.capture_request_body:
             return None
+        try:
+            post_data = request.post_data
+            if post_data:
+                content_type = req_headers.get("content-type", "")
+                if self._should_capture_body(content_type):
+                    if isinstance(post_data, str):
+                        post_data = post_data.encode("utf-8")
+                    return self._parse_body(post_data, content_type)
+        except Exception:
+            pass
+        return None
+
+    def _build_record(
+        self,
+        request: PWRequest,
+        url,
+        start_time: Optional[float],
+        response: PWResponse,
+        resp_headers: dict[str, str],
+        response_body: Optional[any],
+    ) -> dict:
+        """Assemble the IR record dict for one request/response pair.
+
+        The write path works on plain dicts; the IRRecord dataclass is
+        only used when reading records back via from_dict.
+        """
+        # Lowercase header keys once; every later lookup and the filter
+        # pass work on the normalized dict (Playwright usually delivers
+        # lowercase keys, but that isn't guaranteed for all transports)
+        req_headers = {k.lower(): v for k, v in request.headers.items()}
+
+        # Reject methods outside the IR schema's enum (e.g. a custom fetch
+        # method like PROPFIND); the record would not round-trip through
+        # from_dict. Mirrors the ValueError the enum constructor raised on
+        # the old dataclass path, so _on_response routes it to on_error.
+        method = request.method.upper()
+        if method not in _METHOD_MAP:
+            raise ValueError(f"{method!r} is not a valid RequestMethod")
+
+        req: dict = {
+            "method": method,
+            "path": url.path or "/",
+        }
+        if url.scheme:
+            req["scheme"] = url.scheme
+        if url.hostname:
+            req["host"] = url.hostname
+        query = url.query
+        if query:
+            # Collapse single values but keep repeated keys as lists; the
+            # IR schema allows string arrays and inference relies on them
+            parsed_qs = parse_qs(query)
+            if parsed_qs:
+                req["query"] = {
+                    k: v[0] if len(v) == 1 else v for k, v in parsed_qs.items()
+                }
+        headers = self._filter_headers_lc(req_headers)
+        if headers:
+            req["headers"] = headers
+        content_type = req_headers.get("content-type")
+        if content_type:
+            req["contentType"] = content_type
+        request_body = self._get_request_body(request, req_headers)
+        if request_body is not None:
+            req["body"] = request_body
+
+        resp: dict = {"status": response.status}
+        headers = self._filter_headers_lc(resp_headers)
+        if headers:
+            resp["headers"] = headers
+        content_type = resp_headers.get("content-type")
+        if content_type:
+            resp["contentType"] = content_type
+        if response_body is not None:
+            resp["body"] = response_body
+
+        record = {
+            "request": req,
+            "response": resp,
+            "id": _record_id(),
+            "timestamp": _utc_timestamp(),
+            "source": "playwright",
+        }
+        if start_time:
+            record["durationMs"] = (time.time() - start_time) * 1000
+        return record
 
-        # Get timing info
-        start_time = None
-        if request.url in self._pending_requests:
-            _, start_time = self._pending_requests.pop(request.url)
+    def _create_record(self, response: PWResponse) -> Optional[dict]:
+        """Create an IR record dict from a Playwright response (sync)."""
+        request = response.request
 
-        url = urlparse(request.url)
+        # Pop before filtering so excluded requests can't leave stale
+        # entries behind
+        start_time = self._pop_pending(request)
 
-        # Parse query parameters
-        query_params = {}
-        if url.query:
-            parsed = parse_qs(url.query)
-            query_params = {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
+        if not self._should_capture(request):
+            return None
 
-        # Get request body
-        request_body = None
-        if self.options.capture_request_body:
-            try:
-                post_data = request.post_data
-                if post_data:
-                    content_type = request.headers.get("content-type", "")
-                    if self._should_capture_body(content_type):
-                        if isinstance(post_data, str):
-                            post_data = post_data.encode("utf-8")
-                        request_body = self._parse_body(post_data, content_type)
-            except Exception:
-                pass
+        url = _urlparse(request.url)
+        resp_headers = {k.lower(): v for k, v in response.headers.items()}
 
         # Get response body
         response_body = None
-        if self.options.capture_response_body:
+        if self.options.capture_response_body and self._should_read_body(
+            response, request, resp_headers
+        ):
             try:
-                content_type = response.headers.get("content-type", "")
+                content_type = resp_headers.get("content-type", "")
                 if self._should_capture_body(content_type):
-                    body = response.body()
-                    response_body = self._parse_body(body, content_type)
+                    response_body = self._parse_body(response.body(), content_type)
             except Exception:
                 pass
 
-        # Calculate duration
-        duration_ms = None
-        if start_time:
-            duration_ms = (time.time() - start_time) * 1000
-
-        return IRRecord(
-            request=Request(
-                method=RequestMethod(request.method.upper()),
-                path=url.path or "/",
-                scheme=url.scheme,
-                host=url.hostname,
-                query=query_params if query_params else None,
-                headers=self._filter_headers(request.headers) or None,
-                content_type=request.headers.get("content-type"),
-                body=request_body,
-            ),
-            response=Response(
-                status=response.status,
-                headers=self._filter_headers(response.headers) or None,
-                content_type=response.headers.get("content-type"),
-                body=response_body,
-            ),
-            duration_ms=duration_ms,
+        return self._build_record(
+            request, url, start_time, response, resp_headers, response_body
         )
 
-    async def _create_record_async(self, response: PWResponse) -> Optional[IRRecord]:
-        """Create IR record from Playwright response (async)."""
+    async def _create_record_async(self, response: PWResponse) -> Optional[dict]:
+        """Create an IR record dict from a Playwright response (async)."""
         request = response.request
 
+        # Pop before filtering so excluded requests can't leave stale
+        # entries behind
+        start_time = self._pop_pending(request)
+
         if not self._should_capture(request):
             return None
 
-        # Get timing info
-        start_time = None
-        if request.url in self._pending_requests:
-            _, start_time = self._pending_requests.pop(request.url)
-
-        url = urlparse(request.url)
-
-        # Parse query parameters
-        query_params = {}
-        if url.query:
-            parsed = parse_qs(url.query)
-            query_params = {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
-
-        # Get request body
-        request_body = None
-        if self.options.capture_request_body:
-            try:
-                post_data = request.post_data
-                if post_data:
-                    content_type = request.headers.get("content-type", "")
-                    if self._should_capture_body(content_type):
-                        if isinstance(post_data, str):
-                            post_data = post_data.encode("utf-8")
-                        request_body = self._parse_body(post_data, content_type)
-            except Exception:
-                pass
+        url = _urlparse(request.url)
+        resp_headers = {k.lower(): v for k, v in response.headers.items()}
 
         # Get response body (async)
         response_body = None
-        if self.options.capture_response_body:
+        if self.options.capture_response_body and self._should_read_body(
+            response, request, resp_headers
+        ):
             try:
-                content_type = response.headers.get("content-type", "")
+                content_type = resp_headers.get("content-type", "")
                 if self._should_capture_body(content_type):
-                    body = await response.body()
-                    response_body = self._parse_body(body, content_type)
+                    response_body = self._parse_body(await response.body(), content_type)
             except Exception:
                 pass
 
-        # Calculate duration
-        duration_ms = None
-        if start_time:
-            duration_ms = (time.time() - start_time) * 1000
-
-        return IRRecord(
-            request=Request(
-                method=RequestMethod(request.method.upper()),
-                path=url.path or "/",
-                scheme=url.scheme,
-                host=url.hostname,
-                query=query_params if query_params else None,
-                headers=self._filter_headers(request.headers) or None,
-                content_type=request.headers.get("content-type"),
-                body=request_body,
-            ),
-            response=Response(
-                status=response.status,
-                headers=self._filter_headers(response.headers) or None,
-                content_type=response.headers.get("content-type"),
-                body=response_body,
-            ),
-            duration_ms=duration_ms,
+        return self._build_record(
+            request, url, start_time, response, resp_headers, response_body
         )
 
     def flush(self) -> None:
         """Flush any buffered records."""
+        if self._queue is not None:
+            self._queue.join()
         self._writer.flush()
 
     def close(self) -> None:
         """Close the capture and writer."""
+        if self._writer_thread is not None:
+            self._queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
         self._writer.close()
 
     @property
@@ -5,11 +5,78 @@ These types match the JSON Schema at schemas/ir.v1.schema.json.
 """
 
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
+import itertools
 import json
-import uuid
+import os
+import sys
+import time
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Record ids: a per-process random prefix plus a counter, so id
+# generation costs one os.urandom call per process instead of one
+# per record.
+_id_prefix = os.urandom(12)
+_id_counter = itertools.count()
+
+
+# dataclass(slots=True) needs Python 3.10; fall back to dict-backed
+# instances on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality string so duplicates share one object.
+
+    Used when loading NDJSON back: scheme, host, and content type repeat
+    across nearly every record.
+    """
+    return sys.intern(value) if value else value
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize a JSON-compatible object to UTF-8 bytes.
+
+    Uses orjson when installed (``pip install traffic2openapi-playwright[orjson]``),
+    falling back to the stdlib json module.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _record_id() -> str:
+    """Generate a UUID-shaped record id: random prefix + monotonic counter.
+
+    Ids stay unique per process and sort in creation order within it,
+    without per-record randomness.
+    """
+    h = (_id_prefix + next(_id_counter).to_bytes(4, "big")).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# Millisecond-resolution timestamp cache: at high capture rates many
+# records land in the same millisecond and can share one formatted string.
+_ts_cache_ms = -1
+_ts_cache_str = ""
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string with millisecond precision."""
+    global _ts_cache_ms, _ts_cache_str
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _ts_cache_ms:
+        _ts_cache_ms = now_ms
+        dt = datetime.fromtimestamp(now_ms // 1000, tz=timezone.utc)
+        _ts_cache_str = f"{dt.strftime('%Y-%m-%dT%H:%M:%S')}.{now_ms % 1000:03d}Z"
+    return _ts_cache_str
 
 
 class RequestMethod(str, Enum):
@@ -25,7 +92,12 @@ class RequestMethod(str, Enum):
     CONNECT = "CONNECT"
 
 
-@dataclass
+# By-value lookup table: a dict get is much cheaper than the enum
+# __call__/_missing_ machinery invoked by RequestMethod(value)
+_METHOD_MAP = {m.value: m for m in RequestMethod}
+
+
+@dataclass(**_SLOTS)
 class Request:
     """HTTP request details."""
     method: RequestMethod
@@ -42,7 +114,9 @@ class Request:
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         result = {
-            "method": self.method.value if isinstance(self.method, RequestMethod) else self.method,
+            # RequestMethod is a str enum, so json/orjson emit its value
+            # directly without a .value descriptor lookup
+            "method": self.method,
             "path": self.path,
         }
         if self.scheme:
@@ -64,7 +138,7 @@ class Request:
         return result
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Response:
     """HTTP response details."""
     status: int
@@ -84,7 +158,7 @@ class Response:
         return result
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IRRecord:
     """A single HTTP request/response capture."""
     request: Request
@@ -97,9 +171,9 @@ class IRRecord:
     def __post_init__(self):
         """Set defaults after initialization."""
         if self.id is None:
-            self.id = str(uuid.uuid4())
+            self.id = _record_id()
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow().isoformat() + "Z"
+            self.timestamp = _utc_timestamp()
         if self.source is None:
             self.source = "playwright"
 
@@ -121,22 +195,32 @@ class IRRecord:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), separators=(",", ":"))
+        return self.to_json_bytes().decode("utf-8")
+
+    def to_json_bytes(self) -> bytes:
+        """Convert to UTF-8 encoded JSON bytes (orjson when available)."""
+        return dumps_bytes(self.to_dict())
 
     @classmethod
     def from_dict(cls, data: dict) -> "IRRecord":
         """Create an IRRecord from a dictionary."""
         request_data = data["request"]
+        method = _METHOD_MAP.get(request_data["method"])
+        if method is None:
+            # Same error type the enum constructor raised
+            raise ValueError(
+                f"{request_data['method']!r} is not a valid RequestMethod"
+            )
         request = Request(
-            method=RequestMethod(request_data["method"]),
+            method=method,
             path=request_data["path"],
-            scheme=request_data.get("scheme"),
-            host=request_data.get("host"),
+            scheme=_intern(request_data.get("scheme")),
+            host=_intern(request_data.get("host")),
             path_template=request_data.get("pathTemplate"),
             path_params=request_data.get("pathParams"),
             query=request_data.get("query"),
             headers=request_data.get("headers"),
-            content_type=request_data.get("contentType"),
+            content_type=_intern(request_data.get("contentType")),
             body=request_data.get("body"),
         )
 
@@ -144,7 +228,7 @@ class IRRecord:
         response = Response(
             status=response_data["status"],
             headers=response_data.get("headers"),
-            content_type=response_data.get("contentType"),
+            content_type=_intern(response_data.get("contentType")),
             body=response_data.get("body"),
         )
 
@@ -2,12 +2,76 @@
 NDJSON writers for IR records.
 """
 
-import gzip
+import collections
+import concurrent.futures
+import contextlib
+import io
 import threading
 from pathlib import Path
 from typing import IO, Optional, Union
 
-from .types import IRRecord
+from .types import IRRecord, dumps_bytes
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Gzip backend, loaded on first use by the gzip writers so the plain
+# NDJSON path never pays for the import
+_gzip = None
+_MAX_GZIP_LEVEL = 9
+
+
+def _load_gzip():
+    """Import and cache the gzip backend (isal's igzip when installed).
+
+    ISA-L accelerated gzip (pip install traffic2openapi-playwright[isal])
+    only supports compression levels 0-3.
+    """
+    global _gzip, _MAX_GZIP_LEVEL
+    if _gzip is None:
+        try:
+            from isal import igzip as _gzip_mod
+            _MAX_GZIP_LEVEL = 3
+        except ImportError:  # pragma: no cover - optional dependency
+            import gzip as _gzip_mod
+        _gzip = _gzip_mod
+    return _gzip
+
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Accumulate serialized lines in memory and hand them to the OS in
+# chunks of at least this size
+_BUFFER_DRAIN_BYTES = 64 * 1024
+
+
+# Records handed to the writers: either the IRRecord dataclass or a
+# pre-built record dict from the capture hot path.
+Record = Union[IRRecord, dict]
+
+
+def _serialize(record: Record) -> bytes:
+    """Serialize an IR record or pre-built record dict to JSON bytes."""
+    if isinstance(record, IRRecord):
+        return record.to_json_bytes()
+    return dumps_bytes(record)
+
+
+def _serialize_line(record: Record) -> bytes:
+    """Serialize a record to one JSON line, trailing newline included.
+
+    With orjson the newline is appended inside the C serializer via
+    OPT_APPEND_NEWLINE, avoiding an extra bytes concatenation.
+    """
+    if orjson is not None and not isinstance(record, IRRecord):
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return _serialize(record) + b"\n"
 
 
 class NDJSONWriter:
@@ -15,30 +79,39 @@ class NDJSONWriter:
 
     def __init__(
         self,
-        output: Union[str, Path, IO[str]],
+        output: Union[str, Path, IO[bytes]],
         *,
         flush_interval: int = 1,
+        thread_safe: bool = False,
     ):
         """
         Initialize NDJSON writer.
 
         Args:
-            output: File path or file-like object to write to.
+            output: File path or binary file-like object to write to.
             flush_interval: Flush after this many writes (0 = no auto-flush).
+            thread_safe: Guard writes with a lock for multi-threaded producers.
         """
-        self._lock = threading.Lock()
+        self._lock = threading.Lock() if thread_safe else contextlib.nullcontext()
         self._count = 0
         self._flush_interval = flush_interval
         self._closed = False
 
+        self._buf = bytearray()
         if isinstance(output, (str, Path)):
-            self._file: IO[str] = open(output, "w", encoding="utf-8")
+            self._file: IO[bytes] = open(output, "wb", buffering=1 << 20)
             self._owns_file = True
         else:
             self._file = output
             self._owns_file = False
 
-    def write(self, record: IRRecord) -> None:
+    def _drain_buffer(self) -> None:
+        """Write any accumulated bytes to the underlying file."""
+        if self._buf:
+            self._file.write(self._buf)
+            self._buf.clear()
+
+    def write(self, record: Record) -> None:
         """
         Write a single IR record.
 
@@ -52,17 +125,47 @@ class NDJSONWriter:
             if self._closed:
                 raise ValueError("Writer has been closed")
 
-            self._file.write(record.to_json())
-            self._file.write("\n")
+            self._buf += _serialize_line(record)
             self._count += 1
 
+            if len(self._buf) >= _BUFFER_DRAIN_BYTES:
+                self._drain_buffer()
+
             if self._flush_interval > 0 and self._count % self._flush_interval == 0:
+                self._drain_buffer()
+                self._file.flush()
+
+    def write_many(self, records: list) -> None:
+        """
+        Write multiple IR records with a single underlying write call.
+
+        Args:
+            records: The IR records to write.
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        if not records:
+            return
+        with self._lock:
+            if self._closed:
+                raise ValueError("Writer has been closed")
+
+            self._buf += b"".join(map(_serialize_line, records))
+            self._count += len(records)
+
+            if len(self._buf) >= _BUFFER_DRAIN_BYTES:
+                self._drain_buffer()
+
+            if self._flush_interval > 0:
+                self._drain_buffer()
                 self._file.flush()
 
     def flush(self) -> None:
         """Flush any buffered data."""
         with self._lock:
             if not self._closed:
+                self._drain_buffer()
                 self._file.flush()
 
     def close(self) -> None:
@@ -71,6 +174,7 @@ class NDJSONWriter:
             if self._closed:
                 return
             self._closed = True
+            self._drain_buffer()
             self._file.flush()
             if self._owns_file:
                 self._file.close()
@@ -94,30 +198,35 @@ class GzipNDJSONWriter:
         self,
         output: Union[str, Path],
         *,
-        compression_level: int = 9,
+        compression_level: int = 1,
         flush_interval: int = 10,
+        thread_safe: bool = False,
     ):
         """
         Initialize gzip NDJSON writer.
 
         Args:
             output: File path to write to.
-            compression_level: Gzip compression level (1-9).
+            compression_level: Gzip compression level (1-9); defaults to 1
+                for throughput over ratio.
             flush_interval: Flush after this many writes (0 = no auto-flush).
+            thread_safe: Guard writes with a lock for multi-threaded producers.
         """
-        self._lock = threading.Lock()
+        self._lock = threading.Lock() if thread_safe else contextlib.nullcontext()
         self._count = 0
         self._flush_interval = flush_interval
         self._closed = False
 
-        self._file = gzip.open(
-            output,
-            "wt",
-            encoding="utf-8",
-            compresslevel=compression_level,
+        # Buffer small per-record writes so the deflate/CRC path in GzipFile
+        # sees few large chunks instead of many tiny ones.
+        self._gzip = _load_gzip().GzipFile(
+            filename=str(output),
+            mode="wb",
+            compresslevel=min(compression_level, _MAX_GZIP_LEVEL),
         )
+        self._file = io.BufferedWriter(self._gzip, buffer_size=128 * 1024)
 
-    def write(self, record: IRRecord) -> None:
+    def write(self, record: Record) -> None:
         """
         Write a single IR record.
 
@@ -131,18 +240,48 @@ class GzipNDJSONWriter:
             if self._closed:
                 raise ValueError("Writer has been closed")
 
-            self._file.write(record.to_json())
-            self._file.write("\n")
+            self._file.write(_serialize_line(record))
             self._count += 1
 
             if self._flush_interval > 0 and self._count % self._flush_interval == 0:
-                self._file.flush()
+                self._flush_to_disk()
+
+    def write_many(self, records: list) -> None:
+        """
+        Write multiple IR records with a single underlying write call.
+
+        Args:
+            records: The IR records to write.
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        if not records:
+            return
+        with self._lock:
+            if self._closed:
+                raise ValueError("Writer has been closed")
+
+            self._file.write(b"".join(map(_serialize_line, records)))
+            self._count += len(records)
+
+            if self._flush_interval > 0:
+                self._flush_to_disk()
+
+    def _flush_to_disk(self) -> None:
+        """Flush the write buffer and the deflate state through to disk.
+
+        Flushing only the BufferedWriter moves bytes into GzipFile;
+        GzipFile.flush() is what pushes compressed data to the file.
+        """
+        self._file.flush()
+        self._gzip.flush()
 
     def flush(self) -> None:
         """Flush any buffered data."""
         with self._lock:
             if not self._closed:
-                self._file.flush()
+                self._flush_to_disk()
 
     def close(self) -> None:
         """Close the writer and underlying file."""
@@ -162,3 +301,255 @@ class GzipNDJSONWriter:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
+
+
+class GzipMemberNDJSONWriter:
+    """Writes IR records as concatenated independent gzip members.
+
+    Batches of records are compressed in parallel by a small thread pool
+    and appended to the file in submission order. The gzip format allows
+    member concatenation, so the output stays readable with a plain
+    ``gzip.open()`` while compression no longer serializes on one deflate
+    stream.
+    """
+
+    def __init__(
+        self,
+        output: Union[str, Path],
+        *,
+        compression_level: int = 1,
+        batch_size: int = 64,
+        max_workers: int = 4,
+        thread_safe: bool = False,
+    ):
+        """
+        Initialize gzip-member NDJSON writer.
+
+        Args:
+            output: File path to write to.
+            compression_level: Gzip compression level (1-9).
+            batch_size: Records compressed together as one gzip member.
+            max_workers: Thread pool size for parallel compression.
+            thread_safe: Guard writes with a lock for multi-threaded producers.
+        """
+        self._lock = threading.Lock() if thread_safe else contextlib.nullcontext()
+        self._count = 0
+        self._closed = False
+        self._compression_level = compression_level
+        self._batch_size = batch_size
+        self._batch: list[bytes] = []
+        self._futures: collections.deque = collections.deque()
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._gzip_mod = _load_gzip()
+        self._file = open(output, "wb")
+
+    def _submit_batch(self) -> None:
+        """Compress the current batch as one gzip member on the pool."""
+        payload = b"".join(self._batch)
+        self._batch = []
+        self._futures.append(
+            self._pool.submit(
+                self._gzip_mod.compress,
+                payload,
+                min(self._compression_level, _MAX_GZIP_LEVEL),
+            )
+        )
+
+    def _drain(self, wait: bool) -> None:
+        """Append finished members to the file in submission order."""
+        while self._futures:
+            future = self._futures[0]
+            if not wait and not future.done():
+                break
+            self._file.write(future.result())
+            self._futures.popleft()
+
+    def write(self, record: Record) -> None:
+        """
+        Write a single IR record.
+
+        Args:
+            record: The IR record to write.
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError("Writer has been closed")
+
+            self._batch.append(_serialize_line(record))
+            self._count += 1
+
+            if len(self._batch) >= self._batch_size:
+                self._submit_batch()
+                self._drain(wait=False)
+
+    def write_many(self, records: list) -> None:
+        """
+        Write multiple IR records.
+
+        Args:
+            records: The IR records to write.
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        if not records:
+            return
+        with self._lock:
+            if self._closed:
+                raise ValueError("Writer has been closed")
+
+            self._batch.extend(map(_serialize_line, records))
+            self._count += len(records)
+
+            if len(self._batch) >= self._batch_size:
+                self._submit_batch()
+                self._drain(wait=False)
+
+    def flush(self) -> None:
+        """Compress any batched records and flush finished members to disk."""
+        with self._lock:
+            if self._closed:
+                return
+            if self._batch:
+                self._submit_batch()
+            self._drain(wait=True)
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the writer and underlying file."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._batch:
+                self._submit_batch()
+            self._drain(wait=True)
+            self._pool.shutdown()
+            self._file.flush()
+            self._file.close()
+
+    @property
+    def count(self) -> int:
+        """Number of records written."""
+        return self._count
+
+    def __enter__(self) -> "GzipMemberNDJSONWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class ZstdNDJSONWriter:
+    """Writes IR records in zstd-compressed NDJSON format.
+
+    Requires the optional ``zstandard`` package
+    (``pip install traffic2openapi-playwright[zstd]``).
+    """
+
+    def __init__(
+        self,
+        output: Union[str, Path],
+        *,
+        compression_level: int = 3,
+        flush_interval: int = 10,
+        thread_safe: bool = False,
+    ):
+        """
+        Initialize zstd NDJSON writer.
+
+        Args:
+            output: File path to write to.
+            compression_level: Zstd compression level (1-22).
+            flush_interval: Flush after this many writes (0 = no auto-flush).
+            thread_safe: Guard writes with a lock for multi-threaded producers.
+        """
+        if zstandard is None:
+            raise ImportError(
+                "zstandard is required for ZstdNDJSONWriter; "
+                "install with: pip install traffic2openapi-playwright[zstd]"
+            )
+
+        self._lock = threading.Lock() if thread_safe else contextlib.nullcontext()
+        self._count = 0
+        self._flush_interval = flush_interval
+        self._closed = False
+
+        self._raw = open(output, "wb")
+        compressor = zstandard.ZstdCompressor(level=compression_level)
+        self._file = compressor.stream_writer(self._raw)
+
+    def write(self, record: Record) -> None:
+        """
+        Write a single IR record.
+
+        Args:
+            record: The IR record to write.
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError("Writer has been closed")
+
+            self._file.write(_serialize_line(record))
+            self._count += 1
+
+            if self._flush_interval > 0 and self._count % self._flush_interval == 0:
+                self._file.flush(zstandard.FLUSH_BLOCK)
+                self._raw.flush()
+
+    def write_many(self, records: list) -> None:
+        """
+        Write multiple IR records with a single underlying write call.
+
+        Args:
+            records: The IR records to write.
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        if not records:
+            return
+        with self._lock:
+            if self._closed:
+                raise ValueError("Writer has been closed")
+
+            self._file.write(b"".join(map(_serialize_line, records)))
+            self._count += len(records)
+
+            if self._flush_interval > 0:
+                self._file.flush(zstandard.FLUSH_BLOCK)
+                self._raw.flush()
+
+    def flush(self) -> None:
+        """Flush any buffered data."""
+        with self._lock:
+            if not self._closed:
+                self._file.flush(zstandard.FLUSH_BLOCK)
+                self._raw.flush()
+
+    def close(self) -> None:
+        """Close the writer and underlying file."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._file.close()
+            if not self._raw.closed:
+                self._raw.close()
+
+    @property
+    def count(self) -> int:
+        """Number of records written."""
+        return self._count
+
+    def __enter__(self) -> "ZstdNDJSONWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -13,7 +13,12 @@ from traffic2openapi_playwright.capture import (
     CaptureOptions,
     DEFAULT_EXCLUDE_HEADERS,
 )
-from traffic2openapi_playwright.types import RequestMethod
+from traffic2openapi_playwright.types import (
+    IRRecord,
+    Request,
+    Response,
+    RequestMethod,
+)
 
 
 class MockRequest:
@@ -38,6 +43,7 @@ class MockRequest:
     def url(self):
         return self._url
 
+    @property
     def method(self):
         return self._method
 
@@ -69,6 +75,7 @@ class MockResponse:
     def request(self):
         return self._request
 
+    @property
     def status(self):
         return self._status
 
@@ -165,6 +172,14 @@ class TestPlaywrightCapture:
 
         assert output.exists()
 
+    def test_unknown_compression_raises(self, tmp_path: Path):
+        """Test that an unrecognized compression value fails fast."""
+        output = tmp_path / "test.ndjson"
+        opts = CaptureOptions(output=str(output), compression="lz4")
+
+        with pytest.raises(ValueError, match="lz4"):
+            PlaywrightCapture(opts)
+
     def test_should_capture_filter_hosts(self, tmp_path: Path):
         """Test host filtering."""
         output = tmp_path / "test.ndjson"
@@ -236,7 +251,7 @@ class TestPlaywrightCapture:
         output = tmp_path / "test.ndjson"
         opts = CaptureOptions(
             output=str(output),
-            exclude_path_patterns=[re.compile(r"^/_next"), re.compile(r"\.js$")],
+            exclude_path_patterns=[re.compile(r"^/_next"), re.compile(r".*\.js$")],
         )
 
         capture = PlaywrightCapture(opts)
@@ -245,6 +260,11 @@ class TestPlaywrightCapture:
         req1 = MockRequest(url="https://example.com/api/users")
         assert capture._should_capture(req1) is True
 
+        # Patterns are anchored at the start of the path (match semantics),
+        # so "_next" alone would not exclude deeper paths
+        req4 = MockRequest(url="https://example.com/api/_next")
+        assert capture._should_capture(req4) is True
+
         # Should not capture
         req2 = MockRequest(url="https://example.com/_next/static/chunk.js")
         assert capture._should_capture(req2) is False
@@ -333,6 +353,39 @@ class TestPlaywrightCapture:
 
         capture.close()
 
+    def test_should_read_body(self, tmp_path: Path):
+        """Test body-read short-circuit for no-body and oversized responses."""
+        output = tmp_path / "test.ndjson"
+        opts = CaptureOptions(
+            output=str(output),
+            max_body_size=1024,
+        )
+
+        capture = PlaywrightCapture(opts)
+
+        def should_read(resp, req):
+            return capture._should_read_body(resp, req, resp.headers)
+
+        req = MockRequest()
+        assert should_read(MockResponse(req), req) is True
+
+        # No-body statuses
+        assert should_read(MockResponse(req, status=204), req) is False
+        assert should_read(MockResponse(req, status=304), req) is False
+
+        # HEAD requests
+        head = MockRequest(method="HEAD")
+        assert should_read(MockResponse(head), head) is False
+
+        # Declared content length above max_body_size
+        resp = MockResponse(req, headers={"content-length": "2048"})
+        assert should_read(resp, req) is False
+
+        resp = MockResponse(req, headers={"content-length": "512"})
+        assert should_read(resp, req) is True
+
+        capture.close()
+
     def test_parse_body_too_large(self, tmp_path: Path):
         """Test that large bodies are not parsed."""
         output = tmp_path / "test.ndjson"
@@ -363,6 +416,25 @@ class TestPlaywrightCapture:
 
         capture.close()
 
+    def test_parse_body_cache(self, tmp_path: Path):
+        """Test that identical bodies reuse the cached parse result."""
+        output = tmp_path / "test.ndjson"
+
+        capture = PlaywrightCapture(str(output))
+
+        body = b'{"name": "Alice"}'
+        first = capture._parse_body(body, "application/json")
+        second = capture._parse_body(body, "application/json")
+
+        assert first == {"name": "Alice"}
+        assert second is first
+
+        # Same bytes under a different parse mode must not reuse the entry
+        assert capture._parse_body(b"123", "text/plain") == "123"
+        assert capture._parse_body(b"123", "application/json") == 123
+
+        capture.close()
+
     def test_count_property(self, tmp_path: Path):
         """Test count property."""
         output = tmp_path / "test.ndjson"
@@ -370,3 +442,38 @@ class TestPlaywrightCapture:
         capture = PlaywrightCapture(str(output))
         assert capture.count == 0
         capture.close()
+
+    def test_background_writer_drains_on_close(self, tmp_path: Path):
+        """Test that queued records are written before close returns."""
+        output = tmp_path / "test.ndjson"
+
+        capture = PlaywrightCapture(str(output))
+        for i in range(10):
+            capture._write_record(
+                IRRecord(
+                    request=Request(method=RequestMethod.GET, path=f"/r{i}"),
+                    response=Response(status=200),
+                )
+            )
+        capture.close()
+
+        lines = output.read_text().strip().split("\n")
+        assert len(lines) == 10
+        assert capture.count == 10
+
+    def test_inline_write_without_background_thread(self, tmp_path: Path):
+        """Test writing inline when background_write is disabled."""
+        output = tmp_path / "test.ndjson"
+        opts = CaptureOptions(output=str(output), background_write=False)
+
+        capture = PlaywrightCapture(opts)
+        capture._write_record(
+            IRRecord(
+                request=Request(method=RequestMethod.GET, path="/r"),
+                response=Response(status=200),
+            )
+        )
+        assert capture.count == 1
+        capture.close()
+
+        assert len(output.read_text().strip().split("\n")) == 1
@@ -8,7 +8,12 @@ from pathlib import Path
 import pytest
 
 from traffic2openapi_playwright.types import IRRecord, Request, Response, RequestMethod
-from traffic2openapi_playwright.writer import NDJSONWriter, GzipNDJSONWriter
+from traffic2openapi_playwright.writer import (
+    NDJSONWriter,
+    GzipNDJSONWriter,
+    GzipMemberNDJSONWriter,
+    ZstdNDJSONWriter,
+)
 
 
 def create_test_record(path: str = "/test", status: int = 200) -> IRRecord:
@@ -41,6 +46,20 @@ class TestNDJSONWriter:
         assert parsed["id"] == "test-id"
         assert parsed["request"]["path"] == "/test"
 
+    def test_write_record_dict(self, tmp_path: Path):
+        """Test writing a pre-built record dict."""
+        output = tmp_path / "test.ndjson"
+
+        with NDJSONWriter(str(output)) as writer:
+            writer.write({
+                "request": {"method": "GET", "path": "/dict"},
+                "response": {"status": 200},
+            })
+
+        parsed = json.loads(output.read_text().strip())
+        assert parsed["request"]["path"] == "/dict"
+        assert parsed["response"]["status"] == 200
+
     def test_write_multiple_records(self, tmp_path: Path):
         """Test writing multiple records."""
         output = tmp_path / "test.ndjson"
@@ -165,6 +184,15 @@ class TestGzipNDJSONWriter:
             writer.flush()
             # Just verify no errors
 
+    def test_flush_writes_to_disk(self, tmp_path: Path):
+        """Test that flush pushes compressed bytes through to the file."""
+        output = tmp_path / "test.ndjson.gz"
+
+        with GzipNDJSONWriter(str(output), flush_interval=0) as writer:
+            writer.write(create_test_record())
+            writer.flush()
+            assert output.stat().st_size > len(b'\x1f\x8b')
+
     def test_compressed_smaller_than_uncompressed(self, tmp_path: Path):
         """Test that compressed output is smaller."""
         uncompressed = tmp_path / "test.ndjson"
@@ -194,3 +222,81 @@ class TestGzipNDJSONWriter:
                 writer.write(record)
 
         assert compressed.stat().st_size < uncompressed.stat().st_size
+
+
+class TestGzipMemberNDJSONWriter:
+    """Tests for GzipMemberNDJSONWriter."""
+
+    def test_write_readable_with_gzip_open(self, tmp_path: Path):
+        """Test that concatenated members read back as one stream."""
+        output = tmp_path / "test.ndjson.gz"
+
+        with GzipMemberNDJSONWriter(str(output), batch_size=16) as writer:
+            for i in range(100):
+                writer.write(create_test_record(f"/r{i}"))
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            lines = f.read().strip().split("\n")
+
+        assert len(lines) == 100
+        assert writer.count == 100
+        assert json.loads(lines[0])["request"]["path"] == "/r0"
+        assert json.loads(lines[-1])["request"]["path"] == "/r99"
+
+    def test_flush_writes_partial_batch(self, tmp_path: Path):
+        """Test that flush compresses and persists a partial batch."""
+        output = tmp_path / "test.ndjson.gz"
+
+        writer = GzipMemberNDJSONWriter(str(output), batch_size=64)
+        writer.write(create_test_record())
+        writer.flush()
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            lines = f.read().strip().split("\n")
+        assert len(lines) == 1
+
+        writer.close()
+
+    def test_write_after_close_raises(self, tmp_path: Path):
+        """Test that writing after close raises an error."""
+        output = tmp_path / "test.ndjson.gz"
+
+        writer = GzipMemberNDJSONWriter(str(output))
+        writer.write(create_test_record())
+        writer.close()
+
+        with pytest.raises(ValueError, match="closed"):
+            writer.write(create_test_record())
+
+
+class TestZstdNDJSONWriter:
+    """Tests for ZstdNDJSONWriter."""
+
+    def test_write_compressed(self, tmp_path: Path):
+        """Test writing zstd-compressed records."""
+        zstandard = pytest.importorskip("zstandard")
+        output = tmp_path / "test.ndjson.zst"
+
+        with ZstdNDJSONWriter(str(output)) as writer:
+            writer.write(create_test_record("/users", 200))
+            writer.write(create_test_record("/posts", 201))
+
+        # Verify file is zstd compressed
+        with open(output, "rb") as f:
+            data = zstandard.ZstdDecompressor().decompressobj().decompress(f.read())
+        lines = data.decode("utf-8").strip().split("\n")
+
+        assert len(lines) == 2
+        assert writer.count == 2
+
+        parsed = json.loads(lines[0])
+        assert parsed["request"]["path"] == "/users"
+
+    def test_requires_zstandard(self, tmp_path: Path, monkeypatch):
+        """Test that a missing zstandard package raises ImportError."""
+        from traffic2openapi_playwright import writer as writer_mod
+
+        monkeypatch.setattr(writer_mod, "zstandard", None)
+
+        with pytest.raises(ImportError, match="zstandard"):
+            ZstdNDJSONWriter(str(tmp_path / "test.ndjson.zst"))